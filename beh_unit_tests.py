@@ -1,7 +1,8 @@
 import glob
 import time
+import os
 from mcaddon import BehaviorPack, Addon
-from multiprocessing import Pool
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 
 def callback(path):
@@ -17,24 +18,34 @@ def callback(path):
 
 if __name__ == "__main__":
 
-    start = time.time()
+    start = time.perf_counter()
 
     # BEHAVIOR_PACKS
+    paths = glob.glob("tests/units/behavior_packs/*")
 
-    gofast = True
-    if gofast:
+    # "procs" wins when packs are expensive to parse, "threads" when they are
+    # small and numerous since results don't need to be pickled back.
+    gofast = "procs"
+    if gofast == "procs" and paths:
         # This should be used in Addon class to load packs.
-        with Pool(20) as p:
-            packs = p.map(callback, glob.glob("tests/units/behavior_packs/*"))
+        workers = min(len(paths), os.cpu_count() or 4)
+        chunksize = max(1, len(paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            packs = list(ex.map(callback, paths, chunksize=chunksize))
+
+    elif gofast == "threads" and paths:
+        workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            packs = list(ex.map(callback, paths))
 
     else:
         packs = []
-        for path in glob.glob("tests/units/behavior_packs/*"):
+        for path in paths:
             pack = callback(path)
             packs.append(pack)
 
-    print(round(time.time() - start, 2), "ms")
+    print(gofast, round(time.perf_counter() - start, 2), "s")
     addon = Addon()
-    addon.extend(packs)
+    addon.extend([pack for pack in packs if pack is not None])
     print("Saving...")
     addon.save("build/", zipped=False, overwrite=True)
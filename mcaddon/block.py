@@ -34,6 +34,8 @@ from .event import *
 
 
 class BlockComponent(Misc):
+    __slots__ = ()
+
     def __repr__(self):
         return "BlockComponent{" + str(self.id) + "}"
 
@@ -45,11 +47,11 @@ class BlockComponent(Misc):
 
     @property
     def id(self) -> Identifier:
-        return getattr(self, "_id")
+        return self._id
 
     @id.setter
     def id(self, value: Identifier):
-        setattr(self, "_id", Identifier.of(value))
+        self._id = Identifier.of(value)
 
     @staticmethod
     def from_dict(data: dict) -> Self:
@@ -68,6 +70,8 @@ class BlockComponent(Misc):
 
 
 class SimpleBlockComponent(BlockComponent):
+    __slots__ = ("_value", "_clazz")
+
     def __init__(self, value):
         self.value = value
 
@@ -75,9 +79,9 @@ class SimpleBlockComponent(BlockComponent):
         data = self.value
         return data
 
-    @staticmethod
-    def from_dict(data) -> Self:
-        return SimpleBlockComponent(data)
+    @classmethod
+    def from_dict(cls, data) -> Self:
+        return cls(data)
 
     @property
     def clazz(self):
@@ -85,20 +89,20 @@ class SimpleBlockComponent(BlockComponent):
 
     @clazz.setter
     def clazz(self, value):
-        setattr(self, "_clazz", value)
+        self._clazz = value
 
     @property
     def value(self):
-        return getattr(self, "_value")
+        return self._value
 
     @value.setter
     def value(self, value):
-        if self.clazz is not None and not isinstance(value, self.clazz):
+        if __debug__ and self.clazz is not None and not isinstance(value, self.clazz):
             raise TypeError(
                 f"Expected {self.clazz.__name__} but got '{value.__class__.__name__}' instead"
             )
         self.on_update("value", value)
-        setattr(self, "_value", value)
+        self._value = value
 
 
 # COMPONENTS
@@ -111,17 +115,26 @@ def block_component_type(cls):
     Add this block component to the registry
     """
 
-    def wrapper():
-        return INSTANCE.register(Registries.BLOCK_COMPONENT_TYPE, cls.id, cls)
+    return INSTANCE.register(Registries.BLOCK_COMPONENT_TYPE, cls.id, cls)
 
-    return wrapper()
+
+class BlockTriggerComponent(Trigger, BlockComponent):
+    """Base class for block triggers, the event defaults to the trigger's own name."""
+
+    __slots__ = ()
+
+    def __init__(self, event: str = None, condition: str = None, target: str = None):
+        Trigger.__init__(
+            self, self.id.path if event is None else event, condition, target
+        )
 
 
 @block_component_type
-class OnFallOnComponent(Trigger, BlockComponent):
+class OnFallOnComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_fall_on?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_fall_on")
+    __slots__ = ("_min_fall_distance",)
 
     def __init__(
         self,
@@ -130,7 +143,7 @@ class OnFallOnComponent(Trigger, BlockComponent):
         condition: str = None,
         target: str = None,
     ):
-        Trigger.__init__(self, event, condition, target)
+        BlockTriggerComponent.__init__(self, event, condition, target)
         self.min_fall_distance = min_fall_distance
 
     def jsonify(self):
@@ -139,103 +152,75 @@ class OnFallOnComponent(Trigger, BlockComponent):
             data["min_fall_distance"] = self.min_fall_distance
         return data
 
-    @staticmethod
-    def from_dict(data: dict) -> Self:
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
         min_fall_distance = (
             data.pop("min_fall_distance") if "min_fall_distance" in data else 0
         )
-        tr = Trigger(**data)
-        return OnFallOnComponent(tr.event, min_fall_distance, tr.condition, tr.target)
+        self = super().from_dict(data)
+        self.min_fall_distance = min_fall_distance
+        return self
 
     @property
     def min_fall_distance(self) -> float:
         """The event executed on the block, defaults to 'on_fall_on'"""
-        return getattr(self, "_min_fall_distance", None)
+        return self._min_fall_distance
 
     @min_fall_distance.setter
     def min_fall_distance(self, value: float):
         if value is None:
+            self._min_fall_distance = None
             return
         self.on_update("min_fall_distance", float(value))
-        setattr(self, "_min_fall_distance", float(value))
+        self._min_fall_distance = float(value)
 
 
 @block_component_type
-class OnInteractComponent(Trigger, BlockComponent):
+class OnInteractComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_interact?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_interact")
-
-    def __init__(
-        self, event: str = "on_interact", condition: str = None, target: str = None
-    ):
-        Trigger.__init__(self, event, condition, target)
+    __slots__ = ()
 
 
 @block_component_type
-class OnPlacedComponent(Trigger, BlockComponent):
+class OnPlacedComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_placed?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_placed")
-
-    def __init__(
-        self, event: str = "on_placed", condition: str = None, target: str = None
-    ):
-        Trigger.__init__(self, event, condition, target)
+    __slots__ = ()
 
 
 @block_component_type
-class OnPlayerDestroyedComponent(Trigger, BlockComponent):
+class OnPlayerDestroyedComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_player_destroyed?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_player_destroyed")
-
-    def __init__(
-        self,
-        event: str = "on_player_destroyed",
-        condition: str = None,
-        target: str = None,
-    ):
-        Trigger.__init__(self, event, condition, target)
+    __slots__ = ()
 
 
 @block_component_type
-class OnPlayerPlacingComponent(Trigger, BlockComponent):
+class OnPlayerPlacingComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_player_placing?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_player_placing")
-
-    def __init__(
-        self,
-        event: str = "on_player_placing",
-        condition: str = None,
-        target: str = None,
-    ):
-        Trigger.__init__(self, event, condition, target)
+    __slots__ = ()
 
 
 @block_component_type
-class OnStepOffComponent(Trigger, BlockComponent):
+class OnStepOffComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_step_off?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_step_off")
-
-    def __init__(
-        self, event: str = "on_step_off", condition: str = None, target: str = None
-    ):
-        Trigger.__init__(self, event, condition, target)
+    __slots__ = ()
 
 
 @block_component_type
-class OnStepOnComponent(Trigger, BlockComponent):
+class OnStepOnComponent(BlockTriggerComponent):
     """Describes event for this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_on_step_on?view=minecraft-bedrock-stable)"""
 
     id = Identifier("on_step_on")
-
-    def __init__(
-        self, event: str = "on_step_on", condition: str = None, target: str = None
-    ):
-        Trigger.__init__(self, event, condition, target)
+    __slots__ = ()
 
 
 @block_component_type
@@ -243,6 +228,7 @@ class BoneVisabilityComponent(BlockComponent):
     """Tells whether the bone should be visible or not (value)."""
 
     id = Identifier("bone_visibility")
+    __slots__ = ("_bones",)
 
     def __init__(self, bones: dict[str, Molang | bool] = None):
         self.bones = bones
@@ -259,7 +245,7 @@ class BoneVisabilityComponent(BlockComponent):
 
     @property
     def bones(self) -> dict[str, Molang | bool]:
-        return getattr2(self, "_bones", {})
+        return self._bones
 
     @bones.setter
     def bones(self, value: dict[str, Molang | bool]):
@@ -285,6 +271,7 @@ class BreathabilityComponent(SimpleBlockComponent):
     """"""
 
     id = Identifier("breathability")
+    __slots__ = ()
     clazz = str
 
 
@@ -293,6 +280,7 @@ class CollisionBoxComponent(BlockComponent, Box):
     """Defines the area of the block that collides with entities. If set to true, default values are used. If set to false, the block's collision with entities is disabled. If this component is omitted, default values are used. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_collision_box?view=minecraft-bedrock-stable)"""
 
     id = Identifier("collision_box")
+    __slots__ = ()
 
     def __init__(
         self,
@@ -309,12 +297,11 @@ class CollisionBoxComponent(BlockComponent, Box):
         Box.__init__(self, origin, size)
 
     def jsonify(self) -> dict:
-        data = super().as_dict()
         if self.is_cube():
             return True
         elif self.is_none():
             return False
-        return data
+        return self.as_dict()
 
     @staticmethod
     def from_dict(data: dict) -> Self:
@@ -336,6 +323,7 @@ class SelectionBoxComponent(BlockComponent, Box):
     """Defines the area of the block that is selected by the player's cursor. If set to true, default values are used. If set to false, this block is not selectable by the player's cursor. If this component is omitted, default values are used. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_selection_box?view=minecraft-bedrock-stable)"""
 
     id = Identifier("selection_box")
+    __slots__ = ()
 
     def __init__(
         self,
@@ -352,12 +340,11 @@ class SelectionBoxComponent(BlockComponent, Box):
         Box.__init__(self, origin, size)
 
     def jsonify(self) -> dict:
-        data = super().as_dict()
         if self.is_cube():
             return True
         elif self.is_none():
             return False
-        return data
+        return self.as_dict()
 
     @staticmethod
     def from_dict(data: dict) -> Self:
@@ -379,6 +366,7 @@ class CraftingTableComponent(BlockComponent):
     """Makes your block into a custom crafting table which enables the crafting table UI and the ability to craft recipes. This component supports only "recipe_shaped" and "recipe_shapeless" typed recipes and not others like "recipe_furnace" or "recipe_brewing_mix". If there are two recipes for one item, the recipe book will pick the first that was parsed. If two input recipes are the same, crafting may assert and the resulting item may vary. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_crafting_table?view=minecraft-bedrock-stable)"""
 
     id = Identifier("crafting_table")
+    __slots__ = ("_table_name", "_crafting_tags")
 
     def __init__(self, table_name: str, crafting_tags: list[str] = None):
         self.table_name = table_name
@@ -397,22 +385,28 @@ class CraftingTableComponent(BlockComponent):
     @property
     def crafting_tags(self) -> list[str]:
         """Defines the tags recipes should define to be crafted on this table. Limited to 64 tags. Each tag is limited to 64 characters."""
-        return getattr2(self, "_crafting_tags", ["crafting_table"])
+        return self._crafting_tags
 
     @crafting_tags.setter
     def crafting_tags(self, value: list[str]):
+        if __debug__ and isinstance(value, list):
+            for tag in value:
+                if not isinstance(tag, str):
+                    raise TypeError(
+                        f"Expected str but got '{tag.__class__.__name__}' instead"
+                    )
         self.on_update("crafting_tags", value)
         setattr2(self, "_crafting_tags", value, list)
 
     @property
     def table_name(self) -> str:
         """Specifies the language file key that maps to what text will be displayed in the UI of this table. If the string given can not be resolved as a loc string, the raw string given will be displayed. If this field is omitted, the name displayed will default to the name specified in the "display_name" component. If this block has no "display_name" component, the name displayed will default to the name of the block."""
-        return getattr(self, "_table_name")
+        return self._table_name
 
     @table_name.setter
     def table_name(self, value: str):
         self.on_update("table_name", str(value))
-        setattr(self, "_table_name", str(value))
+        self._table_name = str(value)
 
     def get_crafting_tag(self, index: int) -> str | None:
         return self.crafting_tags[index]
@@ -434,6 +428,7 @@ class DestructibleByExplosionComponent(BlockComponent):
     """Describes the destructible by explosion properties for this block. If set to true, the block will have the default explosion resistance. If set to false, this block is indestructible by explosion. If the component is omitted, the block will have the default explosion resistance [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_destructible_by_explosion?view=minecraft-bedrock-stable)"""
 
     id = Identifier("destructible_by_explosion")
+    __slots__ = ("_explosion_resistance",)
 
     def __init__(self, explosion_resistance: float = None):
         self.explosion_resistance = explosion_resistance
@@ -449,18 +444,18 @@ class DestructibleByExplosionComponent(BlockComponent):
     @property
     def explosion_resistance(self) -> float:
         """Sets the explosion resistance for the block. Greater values result in greater resistance to explosions. The scale will be different for different explosion power levels. A negative value or 0 means it will easily explode; larger numbers increase level of resistance."""
-        return getattr(self, "_explosion_resistance")
+        return self._explosion_resistance
 
     @explosion_resistance.setter
     def explosion_resistance(self, value: float):
         if value is None:
             return
-        if not isinstance(value, (float, int)):
+        if __debug__ and not isinstance(value, (float, int)):
             raise TypeError(
                 f"Expected float but got '{value.__class__.__name__}' instead"
             )
         self.on_update("explosion_resistance", value)
-        setattr(self, "_explosion_resistance", value)
+        self._explosion_resistance = value
 
 
 @block_component_type
@@ -468,6 +463,7 @@ class DestructibleByMiningComponent(BlockComponent):
     """Describes the destructible by mining properties for this block. If set to true, the block will take the default number of seconds to destroy. If set to false, this block is indestructible by mining. If the component is omitted, the block will take the default number of seconds to destroy. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_destructible_by_mining?view=minecraft-bedrock-stable)"""
 
     id = Identifier("destructible_by_mining")
+    __slots__ = ("_seconds_to_destroy",)
 
     def __init__(self, seconds_to_destroy: float = None):
         self.seconds_to_destroy = seconds_to_destroy
@@ -483,18 +479,19 @@ class DestructibleByMiningComponent(BlockComponent):
     @property
     def seconds_to_destroy(self) -> float:
         """Sets the number of seconds it takes to destroy the block with base equipment. Greater numbers result in greater mining times."""
-        return getattr(self, "_seconds_to_destroy", None)
+        return self._seconds_to_destroy
 
     @seconds_to_destroy.setter
     def seconds_to_destroy(self, value: float):
         if value is None:
+            self._seconds_to_destroy = None
             return
-        if not isinstance(value, (float, int)):
+        if __debug__ and not isinstance(value, (float, int)):
             raise TypeError(
                 f"Expected float or int but got '{value.__class__.__name__}' instead"
             )
         self.on_update("seconds_to_destroy", value)
-        setattr(self, "_seconds_to_destroy", value)
+        self._seconds_to_destroy = value
 
 
 @block_component_type
@@ -502,6 +499,7 @@ class BlockDisplayNameComponent(SimpleBlockComponent):
     """Specifies the language file key that maps to what text will be displayed when you hover over the block in your inventory and hotbar. If the string given can not be resolved as a loc string, the raw string given will be displayed. If this component is omitted, the name of the block will be used as the display name. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_display_name?view=minecraft-bedrock-stable)"""
 
     id = Identifier("display_name")
+    __slots__ = ()
     clazz = str
 
 
@@ -510,6 +508,7 @@ class FlammableComponent(BlockComponent):
     """Describes the flammable properties for this block. If set to true, default values are used. If set to false, or if this component is omitted, the block will not be able to catch on fire naturally from neighbors, but it can still be directly ignited. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_flammable?view=minecraft-bedrock-stable)"""
 
     id = Identifier("flammable")
+    __slots__ = ("_catch_chance_modifier", "_destroy_chance_modifier")
 
     def __init__(
         self, catch_chance_modifier: int = None, destroy_chance_modifier: int = None
@@ -538,73 +537,57 @@ class FlammableComponent(BlockComponent):
     @property
     def catch_chance_modifier(self) -> int:
         """A modifier affecting the chance that this block will catch flame when next to a fire. Values are greater than or equal to 0, with a higher number meaning more likely to catch on fire. For a "catch_chance_modifier" greater than 0, the fire will continue to burn until the block is destroyed (or it will burn forever if the "destroy_chance_modifier" is 0). If the "catch_chance_modifier" is 0, and the block is directly ignited, the fire will eventually burn out without destroying the block (or it will have a chance to be destroyed if "destroy_chance_modifier" is greater than 0). The default value of 5 is the same as that of Planks."""
-        return getattr(self, "_catch_chance_modifier", None)
+        return self._catch_chance_modifier
 
     @catch_chance_modifier.setter
     def catch_chance_modifier(self, value: int):
         if value is None:
+            self._catch_chance_modifier = None
             return
-        if not isinstance(value, int):
+        if __debug__ and not isinstance(value, int):
             raise TypeError(
                 f"Expected int but got '{value.__class__.__name__}' instead"
             )
         self.on_update("catch_chance_modifier", value)
-        setattr(self, "_catch_chance_modifier", value)
+        self._catch_chance_modifier = value
 
     @property
     def destroy_chance_modifier(self) -> int:
         """A modifier affecting the chance that this block will be destroyed by flames when on fire. Values are greater than or equal to 0, with a higher number meaning more likely to be destroyed by fire. For a "destroy_chance_modifier" of 0, the block will never be destroyed by fire, and the fire will burn forever if the "catch_chance_modifier" is greater than 0. The default value of 20 is the same as that of Planks."""
-        return getattr(self, "_destroy_chance_modifier", None)
+        return self._destroy_chance_modifier
 
     @destroy_chance_modifier.setter
     def destroy_chance_modifier(self, value: int):
         if value is None:
+            self._destroy_chance_modifier = None
             return
-        if not isinstance(value, int):
+        if __debug__ and not isinstance(value, int):
             raise TypeError(
                 f"Expected int but got '{value.__class__.__name__}' instead"
             )
         self.on_update("destroy_chance_modifier", value)
-        setattr(self, "_destroy_chance_modifier", value)
+        self._destroy_chance_modifier = value
 
 
 @block_component_type
-class FrictionComponent(BlockComponent):
+class FrictionComponent(SimpleBlockComponent):
     """Describes the friction for this block in a range of (0.0-0.9). Friction affects an entity's movement speed when it travels on the block. Greater value results in more friction. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_friction?view=minecraft-bedrock-stable)"""
 
     id = Identifier("friction")
+    __slots__ = ()
     clazz = float
 
-    def __init__(self, value: float):
-        self.value = value
-
-    @staticmethod
-    def from_dict(data: dict) -> Self:
-        return FrictionComponent(data)
-
-    def jsonify(self) -> int:
+    def jsonify(self) -> float:
         data = 0.4 if self.value is None else self.value
         return data
 
-    @property
-    def value(self) -> float:
-        return getattr(self, "_value")
-
-    @value.setter
-    def value(self, value: float):
-        if not isinstance(value, float):
-            raise TypeError(
-                f"Expected float but got '{value.__class__.__name__}' instead"
-            )
-        self.on_update("value", value)
-        setattr(self, "_value", value)
-
 
 @block_component_type
 class GeometryComponent(BlockComponent):
     """The description identifier of the geometry file to use to render this block. This identifier must match an existing geometry identifier in any of the currently loaded resource packs. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_geometry?view=minecraft-bedrock-stable)"""
 
     id = Identifier("geometry")
+    __slots__ = ("_geometry", "_bone_visibility", "_culling")
 
     def __init__(
         self,
@@ -642,16 +625,16 @@ class GeometryComponent(BlockComponent):
 
     @property
     def geometry(self) -> str:
-        return getattr(self, "_geometry")
+        return self._geometry
 
     @geometry.setter
     def geometry(self, value: str):
         self.on_update("geometry", str(value))
-        setattr(self, "_geometry", str(value))
+        self._geometry = str(value)
 
     @property
     def bone_visibility(self) -> dict[str, Molang | bool]:
-        return getattr(self, "_bone_visibility", {})
+        return self._bone_visibility
 
     @bone_visibility.setter
     def bone_visibility(self, value: dict[str, Molang | bool]):
@@ -660,11 +643,11 @@ class GeometryComponent(BlockComponent):
 
     @property
     def culling(self) -> Identifier:
-        return getattr(self, "_culling")
+        return self._culling
 
     @culling.setter
     def culling(self, value: Identifiable):
-        setattr(self, "_culling", Identifiable.of(value))
+        self._culling = Identifiable.of(value)
 
 
 @block_component_type
@@ -672,6 +655,7 @@ class LightDampeningComponent(SimpleBlockComponent):
     """The amount that light will be dampened when it passes through the block, in a range (0-15). Higher value means the light will be dampened more. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_light_dampening?view=minecraft-bedrock-stable)"""
 
     id = Identifier("light_dampening")
+    __slots__ = ()
     clazz = int
 
     def jsonify(self) -> int:
@@ -684,6 +668,7 @@ class LightEmissionComponent(SimpleBlockComponent):
     """The amount of light this block will emit in a range (0-15). Higher value means more light will be emitted. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_light_emission?view=minecraft-bedrock-stable)"""
 
     id = Identifier("light_emission")
+    __slots__ = ()
     clazz = int
 
     def jsonify(self) -> str:
@@ -696,6 +681,7 @@ class LootComponent(SimpleBlockComponent):
     """The path to the loot table, relative to the behavior pack. Path string is limited to 256 characters. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_loot?view=minecraft-bedrock-stable)"""
 
     id = Identifier("loot")
+    __slots__ = ()
     clazz = str
 
     @classmethod
@@ -708,6 +694,7 @@ class MapColorComponent(BlockComponent):
     """Sets the color of the block when rendered to a map. The color is represented as a hex value in the format "#RRGGBB". May also be expressed as an array of [R, G, B] from 0 to 255. If this component is omitted, the block will not show up on the map. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_map_color?view=minecraft-bedrock-stable)"""
 
     id = Identifier("map_color")
+    __slots__ = ("_value",)
 
     def __init__(self, value: MapColor | int):
         self.value = value
@@ -721,7 +708,7 @@ class MapColorComponent(BlockComponent):
 
     @property
     def value(self) -> int:
-        return getattr(self, "_value")
+        return self._value
 
     @value.setter
     def value(self, value: int | MapColor):
@@ -729,17 +716,19 @@ class MapColorComponent(BlockComponent):
             value = value._value_
         if isinstance(value, str):
             value = int(value.replace("#", "0x"), 16)
-        if not isinstance(value, int):
+        if __debug__ and not isinstance(value, int):
             raise TypeError(
                 f"Expected int but got '{value.__class__.__name__}' instead"
             )
         self.on_update("value", value)
-        setattr(self, "_value", value)
+        self._value = value
 
 
 class Material(Misc):
     """A material instance definition to map to a material instance in a geometry file. The material instance "*" will be used for any materials that don't have a match."""
 
+    __slots__ = ("_texture", "_ambient_occlusion", "_face_dimming", "_render_method")
+
     def __init__(
         self,
         texture: Identifiable,
@@ -754,12 +743,13 @@ class Material(Misc):
 
     def jsonify(self) -> dict:
         data = {"texture": str(self.texture)}
-        if self.render_method not in [None, RenderMethod.OPAQUE]:
-            data["render_method"] = self.render_method.jsonify()
-        if self.ambient_occlusion not in [None, True]:
-            data["ambient_occlusion"] = self.ambient_occlusion
-        if self.face_dimming not in [None, True]:
-            data["face_dimming"] = self.face_dimming
+        render_method = self._render_method
+        if render_method is not None and render_method is not RenderMethod.OPAQUE:
+            data["render_method"] = render_method.jsonify()
+        if self._ambient_occlusion is False:
+            data["ambient_occlusion"] = False
+        if self._face_dimming is False:
+            data["face_dimming"] = False
         return data
 
     @staticmethod
@@ -769,47 +759,47 @@ class Material(Misc):
     @property
     def texture(self) -> Identifier:
         """Texture name for the material."""
-        return getattr(self, "_texture")
+        return self._texture
 
     @texture.setter
     def texture(self, value: Identifiable):
         id = Identifiable.of(value)
         self.on_update("texture", id)
-        setattr(self, "_texture", id)
+        self._texture = id
 
     @property
     def ambient_occlusion(self) -> bool:
         """Should this material have ambient occlusion applied when lighting? If true, shadows will be created around and underneath the block."""
-        return getattr(self, "_ambient_occlusion", None)
+        return self._ambient_occlusion
 
     @ambient_occlusion.setter
     def ambient_occlusion(self, value: bool):
         if value is None:
-            setattr(self, "_ambient_occlusion", None)
+            self._ambient_occlusion = None
             return
-        if not isinstance(value, bool):
+        if __debug__ and not isinstance(value, bool):
             raise TypeError(
                 f"Expected bool but got '{value.__class__.__name__}' instead"
             )
         self.on_update("ambient_occlusion", value)
-        setattr(self, "_ambient_occlusion", value)
+        self._ambient_occlusion = value
 
     @property
     def face_dimming(self) -> bool:
         """Should this material be dimmed by the direction it's facing?"""
-        return getattr(self, "_face_dimming", None)
+        return self._face_dimming
 
     @face_dimming.setter
     def face_dimming(self, value: bool):
         if value is None:
-            setattr(self, "_face_dimming", None)
+            self._face_dimming = None
             return
-        if not isinstance(value, bool):
+        if __debug__ and not isinstance(value, bool):
             raise TypeError(
                 f"Expected bool but got '{value.__class__.__name__}' instead"
             )
         self.on_update("face_dimming", value)
-        setattr(self, "_face_dimming", value)
+        self._face_dimming = value
 
     @property
     def render_method(self) -> RenderMethod:
@@ -824,15 +814,16 @@ class Material(Misc):
 
         "alpha_test" - Used for a block like the vanilla (unstained) glass. Does not allow for translucency, only fully opaque or fully transparent textures. Also disables backface culling.
         """
-        return getattr(self, "_render_method", None)
+        return self._render_method
 
     @render_method.setter
     def render_method(self, value: RenderMethod):
         if value is None:
+            self._render_method = None
             return
         if isinstance(value, RenderMethod):
             self.on_update("render_method", value)
-            setattr(self, "_render_method", value)
+            self._render_method = value
         else:
             self.render_method = RenderMethod.from_dict(value)
 
@@ -842,6 +833,7 @@ class MaterialInstancesComponent(BlockComponent):
     """The material instances for a block. Maps face or material_instance names in a geometry file to an actual material instance. You can assign a material instance object to any of these faces: "up", "down", "north", "south", "east", "west", or "*". You can also give an instance the name of your choosing such as "my_instance", and then assign it to a face by doing "north":"my_instance". [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_material_instances?view=minecraft-bedrock-stable)"""
 
     id = Identifier("material_instances")
+    __slots__ = ("_materials",)
 
     def __init__(self, materials: dict[str, Material] = None):
         self.materials = materials
@@ -861,7 +853,7 @@ class MaterialInstancesComponent(BlockComponent):
 
     @property
     def materials(self) -> dict[str, Material]:
-        return getattr2(self, "_materials", {})
+        return self._materials
 
     @materials.setter
     def materials(self, value: dict[str, Material]):
@@ -876,7 +868,7 @@ class MaterialInstancesComponent(BlockComponent):
             for name in instance_name:
                 self.add_material(name, material)
             return material
-        if not isinstance(material, Material):
+        if __debug__ and not isinstance(material, Material):
             raise TypeError(
                 f"Expected Material but got '{material.__class__.__name__}' instead"
             )
@@ -890,6 +882,8 @@ class MaterialInstancesComponent(BlockComponent):
 
 
 class BlockDescriptor(Misc):
+    __slots__ = ("_name", "_states", "_tags")
+
     def __init__(self, name: Identifiable = None, states: dict = None, tags: str = "1"):
         self.name = name
         self.states = states
@@ -914,18 +908,18 @@ class BlockDescriptor(Misc):
     @property
     def name(self) -> Identifier:
         """The name of a block."""
-        return getattr(self, "_name", None)
+        return self._name
 
     @name.setter
     def name(self, value: Identifiable):
         id = Identifiable.of(value)
         self.on_update("name", id)
-        setattr(self, "_name", id)
+        self._name = id
 
     @property
     def states(self) -> list:
         """The list of Vanilla block states and their values that the block can have, expressed in key/value pairs."""
-        return getattr2(self, "_states", {})
+        return self._states
 
     @states.setter
     def states(self, value: dict):
@@ -935,21 +929,23 @@ class BlockDescriptor(Misc):
     @property
     def tags(self) -> Molang:
         """A condition using Molang queries that results to true/false that can be used to query for blocks with certain tags."""
-        return getattr(self, "_tags", None)
+        return self._tags
 
     @tags.setter
     def tags(self, value: Molang):
         if value is None:
-            setattr(self, "_tags", None)
+            self._tags = None
             return
         v = Molang(value)
         self.on_update("tags", v)
-        setattr(self, "_tags", v)
+        self._tags = v
 
 
 class BlockFilter(Misc):
     """Sets rules for under what conditions the block can be placed/survive"""
 
+    __slots__ = ("_allowed_faces", "_block_filter")
+
     def __init__(
         self,
         allowed_faces: list[BlockFace] = None,
@@ -961,10 +957,8 @@ class BlockFilter(Misc):
     def jsonify(self) -> dict:
         data = {
             "allowed_faces": [x.jsonify() for x in self.allowed_faces],
-            "block_filter": [],
+            "block_filter": [x.jsonify() for x in self.block_filter],
         }
-        for v in self.block_filter:
-            data["block_filter"].append(v.jsonify())
         return data
 
     @staticmethod
@@ -978,7 +972,7 @@ class BlockFilter(Misc):
     @property
     def allowed_faces(self) -> list[BlockFace]:
         """List of any of the following strings describing which face(s) this block can be placed on: "up", "down", "north", "south", "east", "west", "side", "all". Limited to 6 faces."""
-        return getattr(self, "_allowed_faces", [])
+        return self._allowed_faces
 
     @allowed_faces.setter
     def allowed_faces(self, value: list[BlockFace]):
@@ -988,7 +982,7 @@ class BlockFilter(Misc):
     @property
     def block_filter(self) -> list[BlockDescriptor]:
         """List of blocks that this block can be placed against in the "allowed_faces" direction. Limited to 64 blocks. Each block in this list can either be specified as a String (block name) or as a BlockDescriptor. A BlockDescriptor is an object that allows you to reference a block (or multiple blocks) based on its tags, or based on its name and states."""
-        return getattr(self, "_block_filter", [])
+        return self._block_filter
 
     @block_filter.setter
     def block_filter(self, value: list[BlockDescriptor]):
@@ -1001,7 +995,7 @@ class BlockFilter(Misc):
         return self.allowed_faces[index]
 
     def add_face(self, face: BlockFace):
-        if not isinstance(face, BlockFace):
+        if __debug__ and not isinstance(face, BlockFace):
             raise TypeError(
                 f"Expected BlockFace but got '{face.__class__.__name__}' instead"
             )
@@ -1021,7 +1015,7 @@ class BlockFilter(Misc):
         return self.block_filter[index]
 
     def add_filter(self, filter: BlockDescriptor) -> BlockDescriptor:
-        if not isinstance(filter, BlockDescriptor):
+        if __debug__ and not isinstance(filter, BlockDescriptor):
             raise TypeError(
                 f"Expected BlockDescriptor but got '{filter.__class__.__name__}' instead"
             )
@@ -1041,6 +1035,7 @@ class PlacementFilterComponent(BlockComponent):
     """Sets rules for under what conditions the block can be placed/survive [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_placement_filter?view=minecraft-bedrock-stable)"""
 
     id = Identifier("placement_filter")
+    __slots__ = ("_conditions",)
 
     def __init__(self, conditions: list[BlockFilter] = None):
         self.conditions = conditions
@@ -1050,9 +1045,7 @@ class PlacementFilterComponent(BlockComponent):
             yield i
 
     def jsonify(self) -> dict:
-        data = {"conditions": []}
-        for v in self.conditions:
-            data["conditions"].append(v.jsonify())
+        data = {"conditions": [x.jsonify() for x in self.conditions]}
         return data
 
     @staticmethod
@@ -1065,7 +1058,7 @@ class PlacementFilterComponent(BlockComponent):
     @property
     def conditions(self) -> list[BlockFilter]:
         """List of conditions where the block can be placed/survive. Limited to 64 conditions."""
-        return getattr2(self, "_conditions", [])
+        return self._conditions
 
     @conditions.setter
     def conditions(self, value: list[BlockFilter]):
@@ -1075,9 +1068,9 @@ class PlacementFilterComponent(BlockComponent):
     # CONDITION
 
     def add_condition(self, filter: BlockFilter) -> BlockFilter:
-        if not isinstance(filter, BlockFilter):
+        if __debug__ and not isinstance(filter, BlockFilter):
             raise TypeError(
-                f"Expected Filter but got '{filter.__class__.__name__}' instead"
+                f"Expected BlockFilter but got '{filter.__class__.__name__}' instead"
             )
         self.conditions.append(filter)
         return filter
@@ -1095,6 +1088,7 @@ class QueuedTickingComponent(BlockComponent):
     """Triggers the specified event, either once, or at a regular interval equal to a number of ticks randomly chosen from the interval_range provided [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_queued_ticking?view=minecraft-bedrock-stable)"""
 
     id = Identifier("queued_ticking")
+    __slots__ = ("_interval_range", "_on_tick", "_looping")
 
     def __init__(self, interval_range: Range, on_tick: Trigger, looping: bool = None):
         self.interval_range = interval_range
@@ -1120,46 +1114,47 @@ class QueuedTickingComponent(BlockComponent):
     @property
     def interval_range(self) -> Range:
         """A range of values, specified in ticks, that will be used to decide the interval between times this event triggers. Each interval will be chosen randomly from the range, so the times between this event triggering will differ given an interval_range of two different values. If the values in the interval_range are the same, the event will always be triggered after that number of ticks."""
-        return getattr(self, "_interval_range")
+        return self._interval_range
 
     @interval_range.setter
     def interval_range(self, value: Range):
-        if not isinstance(value, Range):
+        if __debug__ and not isinstance(value, Range):
             raise TypeError(
                 f"Expected Range but got '{value.__class__.__name__}' instead"
             )
         self.on_update("interval_range", value)
-        setattr(self, "_interval_range", value)
+        self._interval_range = value
 
     @property
     def on_tick(self) -> Trigger:
         """The event that will be triggered once or on an interval."""
-        return getattr(self, "_on_tick")
+        return self._on_tick
 
     @on_tick.setter
     def on_tick(self, value: Trigger):
-        if not isinstance(value, Trigger):
+        if __debug__ and not isinstance(value, Trigger):
             raise TypeError(
                 f"Expected Trigger but got '{value.__class__.__name__}' instead"
             )
         self.on_update("on_tick", value)
-        setattr(self, "_on_tick", value)
+        self._on_tick = value
 
     @property
     def looping(self) -> bool:
         """Does the event loop? If false, the event will only be triggered once, after a delay equal to a number of ticks randomly chosen from the interval_range. If true, the event will loop, and each interval between events will be equal to a number of ticks randomly chosen from the interval_range."""
-        return getattr(self, "_looping", None)
+        return self._looping
 
     @looping.setter
     def looping(self, value: bool):
         if value is None:
+            self._looping = None
             return
-        if not isinstance(value, bool):
+        if __debug__ and not isinstance(value, bool):
             raise TypeError(
                 f"Expected bool but got '{value.__class__.__name__}' instead"
             )
         self.on_update("looping", value)
-        setattr(self, "_looping", value)
+        self._looping = value
 
 
 @block_component_type
@@ -1167,6 +1162,7 @@ class RandomTickingComponent(BlockComponent):
     """Triggers the specified event randomly based on the random tick speed gamerule. The random tick speed determines how often blocks are updated. Some other examples of game mechanics that use random ticking are crop growth and fire spreading [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blocktriggers/minecraftblock_random_ticking?view=minecraft-bedrock-stable)"""
 
     id = Identifier("random_ticking")
+    __slots__ = ("_on_tick",)
 
     def __init__(self, on_tick: Trigger):
         self.on_tick = on_tick
@@ -1183,16 +1179,16 @@ class RandomTickingComponent(BlockComponent):
     @property
     def on_tick(self) -> Trigger:
         """The event that will be triggered on random ticks."""
-        return getattr(self, "_on_tick")
+        return self._on_tick
 
     @on_tick.setter
     def on_tick(self, value: Trigger):
-        if not isinstance(value, Trigger):
+        if __debug__ and not isinstance(value, Trigger):
             raise TypeError(
                 f"Expected Trigger but got '{value.__class__.__name__}' instead"
             )
         self.on_update("on_tick", value)
-        setattr(self, "_on_tick", value)
+        self._on_tick = value
 
 
 @block_component_type
@@ -1200,6 +1196,7 @@ class TransformationComponent(BlockComponent):
     """The block's translation, rotation and scale with respect to the center of its world position [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockcomponents/minecraftblock_transformation?view=minecraft-bedrock-stable)"""
 
     id = Identifier("transformation")
+    __slots__ = ("_rotation", "_translation", "_scale")
 
     def __init__(
         self,
@@ -1213,30 +1210,24 @@ class TransformationComponent(BlockComponent):
 
     @classmethod
     def rotate(cls, x: int, y: int, z: int) -> Self:
-        self = cls.__new__(cls)
-        self.rotation = Vector3(x, y, z)
-        return self
+        return cls(rotation=Vector3(x, y, z))
 
     @classmethod
     def offset(cls, x: int, y: int, z: int) -> Self:
-        self = cls.__new__(cls)
-        self.translation = Vector3(x, y, z)
-        return self
+        return cls(translation=Vector3(x, y, z))
 
     @classmethod
     def scaled(cls, x: int, y: int, z: int) -> Self:
-        self = cls.__new__(cls)
-        self.scale = Vector3(x, y, z)
-        return self
+        return cls(scale=Vector3(x, y, z))
 
     def jsonify(self) -> dict:
         data = {}
-        if self.rotation is not None:
-            data["rotation"] = self.rotation.jsonify()
-        if self.translation is not None:
-            data["translation"] = self.translation.jsonify()
-        if self.scale is not None:
-            data["scale"] = self.scale.jsonify()
+        if self._rotation is not None:
+            data["rotation"] = self._rotation.jsonify()
+        if self._translation is not None:
+            data["translation"] = self._translation.jsonify()
+        if self._scale is not None:
+            data["scale"] = self._scale.jsonify()
         return data
 
     @staticmethod
@@ -1254,51 +1245,51 @@ class TransformationComponent(BlockComponent):
 
     @property
     def rotation(self) -> Vector3:
-        return getattr(self, "_rotation", None)
+        return self._rotation
 
     @rotation.setter
     def rotation(self, value: Vector3):
         if value is None:
-            setattr(self, "_rotation", None)
+            self._rotation = None
             return
-        if not isinstance(value, Vector3):
+        if __debug__ and not isinstance(value, Vector3):
             raise TypeError(
                 f"Expected Vector3 but got '{value.__class__.__name__}' instead"
             )
         self.on_update("rotation", value)
-        setattr(self, "_rotation", value)
+        self._rotation = value
 
     @property
     def translation(self) -> Vector3:
-        return getattr(self, "_translation", None)
+        return self._translation
 
     @translation.setter
     def translation(self, value: Vector3):
         if value is None:
-            setattr(self, "_translation", None)
+            self._translation = None
             return
-        if not isinstance(value, Vector3):
+        if __debug__ and not isinstance(value, Vector3):
             raise TypeError(
                 f"Expected Vector3 but got '{value.__class__.__name__}' instead"
             )
         self.on_update("translation", value)
-        setattr(self, "_translation", value)
+        self._translation = value
 
     @property
     def scale(self) -> Vector3:
-        return getattr(self, "_scale", None)
+        return self._scale
 
     @scale.setter
     def scale(self, value: Vector3):
         if value is None:
-            setattr(self, "_scale", None)
+            self._scale = None
             return
-        if not isinstance(value, Vector3):
+        if __debug__ and not isinstance(value, Vector3):
             raise TypeError(
                 f"Expected Vector3 but got '{value.__class__.__name__}' instead"
             )
         self.on_update("scale", value)
-        setattr(self, "_scale", value)
+        self._scale = value
 
 
 @block_component_type
@@ -1306,6 +1297,7 @@ class UnitCubeComponent(BlockComponent):
     """Specifies that a unit cube is to be used with tessellation."""
 
     id = Identifier("unit_cube")
+    __slots__ = ()
 
     def __init__(self): ...
 
@@ -1322,6 +1314,7 @@ class BlockTagsComponent(BlockComponent):
     """desc"""
 
     id = Identifier("tags")
+    __slots__ = ("_tags",)
 
     def __init__(self, tags: list[Identifier] = None):
         self.tags = tags
@@ -1338,7 +1331,7 @@ class BlockTagsComponent(BlockComponent):
 
     @property
     def tags(self) -> list[Identifier]:
-        return getattr2(self, "_tags", [])
+        return self._tags
 
     @tags.setter
     def tags(self, value: list[Identifiable]):
@@ -1366,6 +1359,8 @@ class BlockTagsComponent(BlockComponent):
 
 
 class BlockTrait(Misc):
+    __slots__ = ("_id", "_enabled_states")
+
     def __init__(self, enabled_states: list[BlockProperty]):
         self.enabled_states = enabled_states
 
@@ -1386,13 +1381,13 @@ class BlockTrait(Misc):
 
     @property
     def id(self) -> Identifier:
-        return getattr(self, "_id")
+        return self._id
 
     @id.setter
     def id(self, value: Identifier):
         id = Identifier.of(value)
         self.on_update("id", id)
-        setattr(self, "_id", id)
+        self._id = id
 
     @property
     def enabled_states(self) -> list[BlockProperty]:
@@ -1404,15 +1399,13 @@ class BlockTrait(Misc):
         if value is None:
             self.enabled_states = []
         elif isinstance(value, list):
-            v = []
-            for x in value:
-                if not issubclass(x, BlockProperty):
-                    raise TypeError(
-                        f"Expected BlockProperty but got '{x.__class__.__name__}' instead"
-                    )
-                v.append(x())
+            if __debug__:
+                for x in value:
+                    if not isinstance(x, type) or not issubclass(x, BlockProperty):
+                        raise TypeError(f"Expected BlockProperty but got {x!r} instead")
+            v = [x() for x in value]
             self.on_update("enabled_states", v)
-            setattr(self, "_enabled_states", v)
+            self._enabled_states = v
         else:
             raise TypeError(
                 f"Expected list but got '{value.__class__.__name__}' instead"
@@ -1441,13 +1434,9 @@ def block_trait(cls):
     """
     Add this block trait to the registry
     """
-
-    def wrapper():
-        if not issubclass(cls, BlockTrait):
-            raise TypeError(f"Expected BlockTrait but got '{cls.__name__}' instead")
-        return INSTANCE.register(Registries.BLOCK_TRAIT, cls.id, cls)
-
-    return wrapper()
+    if not issubclass(cls, BlockTrait):
+        raise TypeError(f"Expected BlockTrait but got '{cls.__name__}' instead")
+    return INSTANCE.register(Registries.BLOCK_TRAIT, cls.id, cls)
 
 
 @block_trait
@@ -1455,14 +1444,19 @@ class PlacementDirectionTrait(BlockTrait):
     """Adds the CardinalDirectionState and/or FacingDirectionState states and setter function to the block. The values of these states are set when the block is placed."""
 
     id = Identifier("placement_direction")
+    __slots__ = ("_y_rotation_offset",)
 
     def __init__(
-        self, enabled_states: list[BlockProperty] = [], y_rotation_offset: float = 0.0
+        self,
+        enabled_states: list[BlockProperty] = None,
+        y_rotation_offset: float = 0.0,
     ):
-        for state in enabled_states:
-            if not issubclass(state, (CardinalDirectionState, FacingDirectionState)):
+        for state in enabled_states or ():
+            if not isinstance(state, type) or not issubclass(
+                state, (CardinalDirectionState, FacingDirectionState)
+            ):
                 raise TypeError(
-                    f"Expected CardinalDirectionState or FacingDirectionState but got '{state.__class__.__name__}' instead"
+                    f"Expected CardinalDirectionState or FacingDirectionState but got {state!r} instead"
                 )
         BlockTrait.__init__(self, enabled_states)
         if y_rotation_offset not in [0.0, 90.0, 180.0, 270.0, 0, 90, 180, 270]:
@@ -1487,7 +1481,7 @@ class PlacementDirectionTrait(BlockTrait):
         elif value in [0.0, 90.0, 180.0, 270.0, 0, 90, 180, 270]:
             v = float(value)
             self.on_update("y_rotation_offset", v)
-            setattr(self, "_y_rotation_offset", v)
+            self._y_rotation_offset = v
         else:
             raise TypeError(
                 f"Expected 0.0, 90.0, 180.0, 270.0 but got '{value.__class__.__name__}' instead"
@@ -1542,12 +1536,15 @@ class PlacementPositionTrait(BlockTrait):
     """Adds the BlockFaceState and/or VerticalHalfState BlockPropertys. The value of these state(s) are set when the block is placed."""
 
     id = Identifier("placement_position")
+    __slots__ = ()
 
-    def __init__(self, enabled_states: list[BlockProperty] = []):
-        for state in enabled_states:
-            if not issubclass(state, (BlockFaceState, VerticalHalfState)):
+    def __init__(self, enabled_states: list[BlockProperty] = None):
+        for state in enabled_states or ():
+            if not isinstance(state, type) or not issubclass(
+                state, (BlockFaceState, VerticalHalfState)
+            ):
                 raise TypeError(
-                    f"Expected BlockFaceState or VerticalHalfState but got '{state.__class__.__name__}' instead"
+                    f"Expected BlockFaceState or VerticalHalfState but got {state!r} instead"
                 )
         BlockTrait.__init__(self, enabled_states)
 
@@ -1587,13 +1584,29 @@ class PlacementPositionTrait(BlockTrait):
 # BLOCK
 
 
+def _jsonify_components(components: dict[Identifier, BlockComponent]) -> dict:
+    data = {}
+    for k, v in components.items():
+        if isinstance(v, BlockTagsComponent):  # Override BlockTagsComponent
+            for tag in v.tags:
+                data["tag:" + str(tag)] = {}
+        else:
+            data[str(k)] = v.jsonify()
+    return data
+
+
 class BlockPermutation(Misc):
+    __slots__ = ("_condition", "_components")
+
     def __init__(
         self,
         condition: Molang | str,
         components: dict[Identifiable, BlockComponent] = None,
     ):
-        self.condition = Molang(condition)
+        # Molang is an immutable str, so an existing condition can be shared
+        self.condition = (
+            condition if isinstance(condition, Molang) else Molang(condition)
+        )
         self.components: dict[Identifier, BlockComponent] = components
 
     def __str__(self) -> str:
@@ -1604,19 +1617,20 @@ class BlockPermutation(Misc):
         condition = Molang(data.pop("condition"))
         components = {}
         tags = BlockTagsComponent()
+        registry = INSTANCE.get_registry(Registries.BLOCK_COMPONENT_TYPE)
         for k, v in data.pop("components").items():
             id = Identifiable.of(k)
             if str(id).startswith("tag:"):
                 tags.add_tag(id.path)
                 continue
-            clazz = INSTANCE.get_registry(Registries.BLOCK_COMPONENT_TYPE).get(id)
+            clazz = registry.get(id)
             if clazz is None:
                 raise ComponentNotFoundError(repr(id))
             components[id] = clazz.from_dict(v)
 
         # Add tag
         if len(tags.tags) >= 1:
-            components[Identifier("tags")] = tags
+            components[tags.id] = tags
         return BlockPermutation(condition, components)
 
     @staticmethod
@@ -1628,18 +1642,15 @@ class BlockPermutation(Misc):
         return BlockPermutation(Molang(f"q.block_state('{prop.id}')=={repr(value)}"))
 
     def jsonify(self) -> dict:
-        data = {"condition": str(self.condition), "components": {}}
-        for k, v in self.components.items():
-            if k == "minecraft:tags":  # Override BlockTagsComponent
-                for tag in v.tags:
-                    data["components"]["tag:" + str(tag)] = {}
-            else:
-                data["components"][str(k)] = v.jsonify()
+        data = {
+            "condition": str(self.condition),
+            "components": _jsonify_components(self.components),
+        }
         return data
 
     @property
     def condition(self) -> Molang:
-        return getattr(self, "_condition")
+        return self._condition
 
     @condition.setter
     def condition(self, value: Molang):
@@ -1648,7 +1659,7 @@ class BlockPermutation(Misc):
                 f"Expected Molang but got '{value.__class__.__name__}' instead"
             )
         self.on_update("condition", value)
-        setattr(self, "_condition", value)
+        self._condition = value
 
     @property
     def components(self) -> dict[Identifier, BlockComponent]:
@@ -1667,7 +1678,7 @@ class BlockPermutation(Misc):
         for k, v in value.items():
             components[Identifiable.of(k)] = v
         self.on_update("components", components)
-        setattr(self, "_components", components)
+        self._components = components
 
     def add_component(self, component: BlockComponent) -> BlockComponent:
         component.generate(self)
@@ -1810,13 +1821,13 @@ class BlockState(Misc):
 
     @property
     def name(self) -> Identifier:
-        return getattr(self, "_name")
+        return self._name
 
     @name.setter
     def name(self, value: Identifiable):
         id = Identifiable.of(value)
         self.on_update("name", id)
-        setattr(self, "_name", id)
+        self._name = id
 
     @property
     def states(self) -> dict:
@@ -1834,7 +1845,7 @@ class BlockState(Misc):
         for k, v in value.items():
             states[Identifiable.of(k)] = v
         self.on_update("states", states)
-        setattr(self, "_states", states)
+        self._states = states
 
     @staticmethod
     def of(value) -> Self:
@@ -1889,7 +1900,7 @@ class BlockPredicate(Misc):
             return
         id = Identifiable.of(value)
         self.on_update("name", id)
-        setattr(self, "_name", id)
+        self._name = id
 
     @property
     def states(self) -> dict:
@@ -1907,7 +1918,7 @@ class BlockPredicate(Misc):
         for k, v in value.items():
             states[Identifiable.of(k)] = v
         self.on_update("states", states)
-        setattr(self, "_states", states)
+        self._states = states
 
     @property
     def tags(self) -> Molang:
@@ -1923,7 +1934,7 @@ class BlockPredicate(Misc):
             )
         v = Molang(value)
         self.on_update("tags", v)
-        setattr(self, "_tags", v)
+        self._tags = v
 
     @staticmethod
     def of(value) -> Self:
@@ -2009,7 +2020,7 @@ class Block(JsonFile, Identifiable):
     def type(self, value: Identifiable):
         id = Identifiable.of(value)
         self.on_update("type", id)
-        setattr(self, "_type", id)
+        self._type = id
 
     @property
     def menu_category(self) -> MenuCategory:
@@ -2018,14 +2029,14 @@ class Block(JsonFile, Identifiable):
     @menu_category.setter
     def menu_category(self, value: MenuCategory):
         if value is None:
-            setattr(self, "_menu_category", None)
+            self._menu_category = None
             return None
         if not isinstance(value, MenuCategory):
             raise TypeError(
                 f"Expected MenuCategory but got '{value.__class__.__name__}' instead"
             )
         self.on_update("menu_category", value)
-        setattr(self, "_menu_category", value)
+        self._menu_category = value
 
     @property
     def components(self) -> dict[str, BlockComponent]:
@@ -2062,7 +2073,7 @@ class Block(JsonFile, Identifiable):
         for k, v in value.items():
             events[Identifiable.of(k)] = v
         self.on_update("events", events)
-        setattr(self, "_events", events)
+        self._events = events
 
     @property
     def states(self) -> dict[Identifier, BlockProperty]:
@@ -2081,7 +2092,7 @@ class Block(JsonFile, Identifiable):
         for k, v in value.items():
             states[Identifiable.of(k)] = v
         self.on_update("states", states)
-        setattr(self, "_states", states)
+        self._states = states
 
     @property
     def traits(self) -> dict[Identifier, BlockTrait]:
@@ -2100,7 +2111,7 @@ class Block(JsonFile, Identifiable):
         for k, v in value.items():
             traits[Identifiable.of(k)] = v
         self.on_update("traits", traits)
-        setattr(self, "_traits", traits)
+        self._traits = traits
 
     @property
     def sound_group(self) -> str | None:
@@ -2109,11 +2120,11 @@ class Block(JsonFile, Identifiable):
     @sound_group.setter
     def sound_group(self, value: str | None):
         if value is None:
-            setattr(self, "_sound_group", None)
+            self._sound_group = None
             return
         v = str(value)
         self.on_update("sound_group", v)
-        setattr(self, "_sound_group", v)
+        self._sound_group = v
 
     @property
     def name(self) -> str | None:
@@ -2121,7 +2132,7 @@ class Block(JsonFile, Identifiable):
 
     @name.setter
     def name(self, value: str):
-        setattr(self, "_name", str(value))
+        self._name = str(value)
 
     # Read-Only
 
@@ -2165,41 +2176,32 @@ class Block(JsonFile, Identifiable):
         return settings.build(self)
 
     def jsonify(self) -> dict:
-        block = {"description": {"identifier": str(self.identifier)}}
+        description = {"identifier": str(self.identifier)}
+        block = {"description": description}
         if self.menu_category:
-            block["description"]["menu_category"] = self.menu_category.jsonify()
+            description["menu_category"] = self.menu_category.jsonify()
 
         if self.traits:
-            block["description"]["traits"] = {}
-            for k, v in self.traits.items():
-                block["description"]["traits"][str(k)] = v.jsonify()
+            description["traits"] = {
+                str(k): v.jsonify() for k, v in self.traits.items()
+            }
 
         if self.states:
-            block["description"]["states"] = {}
-            for k, v in self.states.items():
-                block["description"]["states"].update(v.jsonify())
+            states = description["states"] = {}
+            for v in self.states.values():
+                states.update(v.jsonify())
 
         if self.components:
-            block["components"] = {}
-            for k, v in self.components.items():
-                if k == "minecraft:tags":  # Override BlockTagsComponent
-                    for tag in v.tags:
-                        block["components"]["tag:" + str(tag)] = {}
-                else:
-                    block["components"][str(k)] = v.jsonify()
+            block["components"] = _jsonify_components(self.components)
 
         if self.permutations:
-            block["permutations"] = []
-            for v in self.permutations:
-                block["permutations"].append(v.jsonify())
+            block["permutations"] = [v.jsonify() for v in self.permutations]
 
         if self.events:
-            block["events"] = {}
-            for key, events in self.events.items():
-                d = {}
-                for k, v in events.items():
-                    d[k.path] = v.jsonify()
-                block["events"][str(key)] = d
+            block["events"] = {
+                str(key): {k.path: v.jsonify() for k, v in events.items()}
+                for key, events in self.events.items()
+            }
 
         data = {"format_version": VERSION["BLOCK"], str(self.id): block}
         if self.type:
@@ -2284,7 +2286,7 @@ class Block(JsonFile, Identifiable):
     # COMPONENT
 
     def add_component(self, component: BlockComponent) -> BlockComponent:
-        if not isinstance(component, BlockComponent):
+        if __debug__ and not isinstance(component, BlockComponent):
             raise TypeError(
                 f"Expected BlockComponent but got '{component.__class__.__name__}' instead"
             )
@@ -2292,7 +2294,7 @@ class Block(JsonFile, Identifiable):
             component.event.namespace = self.identifier.namespace
         component.generate(self)
         self.components[component.id] = component
-        return additem(self, "components", component, component.id, BlockComponent)
+        return component
 
     def get_component(self, id: Identifiable) -> BlockComponent:
         return getitem(self, "components", Identifiable.of(id))
@@ -2316,12 +2318,12 @@ class Block(JsonFile, Identifiable):
     def add_event(self, id: Identifiable, event: Event) -> Event:
         if isinstance(event, Event):
             k = self._event_id(id)
-            if k in self.events:
-                event.generate(self)
-                self.events[k][event.id] = event
-                return event
-            self.events[k] = {}
-            return self.add_event(id, event)
+            events = self.events.get(k)
+            if events is None:
+                events = self.events[k] = {}
+            event.generate(self)
+            events[event.id] = event
+            return event
         elif isinstance(event, list):
             x = Sequence()
             for e in event:
@@ -2329,7 +2331,7 @@ class Block(JsonFile, Identifiable):
             return self.add_event(id, x)
         else:
             raise TypeError(
-                f"Expected BlockEvent but got '{event.__class__.__name__}' instead"
+                f"Expected Event but got '{event.__class__.__name__}' instead"
             )
 
     def add_events(self, id: Identifiable, *events: Event) -> list[Event]:
@@ -2374,7 +2376,7 @@ class Block(JsonFile, Identifiable):
     # TRAIT
 
     def add_trait(self, trait: BlockTrait) -> BlockTrait:
-        if not isinstance(trait, BlockTrait):
+        if __debug__ and not isinstance(trait, BlockTrait):
             raise TypeError(
                 f"Expected BlockTrait but got '{trait.__class__.__name__}' instead"
             )
@@ -2398,7 +2400,7 @@ class Block(JsonFile, Identifiable):
     # STATE
 
     def add_state(self, state: BlockProperty) -> BlockProperty:
-        if not isinstance(state, BlockProperty):
+        if __debug__ and not isinstance(state, BlockProperty):
             raise TypeError(
                 f"Expected BlockProperty but got '{state.__class__.__name__}' instead"
             )
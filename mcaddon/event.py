@@ -21,6 +21,8 @@ from .util import (
 class Event(Misc):
     """Base event class for items and blocks"""
 
+    __slots__ = ("_target", "_id")
+
     def __init__(self, target: EventTarget = None):
         self.target = target
 
@@ -42,7 +44,7 @@ class Event(Misc):
         if value is None:
             self.target = EventTarget.SELF
             return
-        if not isinstance(value, EventTarget):
+        if __debug__ and not isinstance(value, EventTarget):
             raise TypeError(
                 f"Expected EventTarget but got '{value.__class__.__name__}' instead"
             )
@@ -58,7 +60,7 @@ class Event(Misc):
 
     @property
     def id(self) -> Identifier:
-        return getattr(self, "_id")
+        return self._id
 
     @id.setter
     def id(self, value: Identifier):
@@ -83,13 +85,9 @@ def event_type(cls):
     """
     Add this event to the registry
     """
-
-    def wrapper():
-        if not issubclass(cls, Event):
-            raise TypeError(f"Expected Event but got '{cls.__name__}' instead")
-        return INSTANCE.register(Registries.EVENT_TYPE, cls.id, cls)
-
-    return wrapper()
+    if not issubclass(cls, Event):
+        raise TypeError(f"Expected Event but got '{cls.__name__}' instead")
+    return INSTANCE.register(Registries.EVENT_TYPE, cls.id, cls)
 
 
 @event_type
@@ -97,6 +95,7 @@ class AddMobEffect(Event):
     """Apply mob effect to target. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_add_mob_effect?view=minecraft-bedrock-stable)"""
 
     id = Identifier("add_mob_effect")
+    __slots__ = ("_effect", "_amplifier", "_duration")
 
     def __init__(
         self,
@@ -131,7 +130,7 @@ class AddMobEffect(Event):
 
     @property
     def effect(self) -> Identifier:
-        return getattr(self, "_effect")
+        return self._effect
 
     @effect.setter
     def effect(self, value: Identifiable):
@@ -141,7 +140,7 @@ class AddMobEffect(Event):
 
     @property
     def amplifier(self) -> int:
-        return getattr(self, "_amplifier")
+        return self._amplifier
 
     @amplifier.setter
     def amplifier(self, value: int):
@@ -155,7 +154,7 @@ class AddMobEffect(Event):
 
     @property
     def duration(self) -> float:
-        return getattr(self, "_duration")
+        return self._duration
 
     @duration.setter
     def duration(self, value: float):
@@ -173,6 +172,7 @@ class Damage(Event):
     """Deals damage to the target. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_damage?view=minecraft-bedrock-stable)"""
 
     id = Identifier("damage")
+    __slots__ = ("_type", "_amount", "_mob_amount")
 
     def __init__(
         self,
@@ -211,7 +211,7 @@ class Damage(Event):
 
     @property
     def type(self) -> Identifier:
-        return getattr(self, "_type")
+        return self._type
 
     @type.setter
     def type(self, value: Identifiable):
@@ -221,7 +221,7 @@ class Damage(Event):
 
     @property
     def amount(self) -> int:
-        return getattr(self, "_amount")
+        return self._amount
 
     @amount.setter
     def amount(self, value: int):
@@ -235,7 +235,7 @@ class Damage(Event):
 
     @property
     def mob_amount(self) -> int:
-        return getattr(self, "_mob_amount")
+        return self._mob_amount
 
     @mob_amount.setter
     def mob_amount(self, value: int):
@@ -253,6 +253,7 @@ class DecrementStack(Event):
     """Decrement item stack. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_decrement_stack?view=minecraft-bedrock-stable)"""
 
     id = Identifier("decrement_stack")
+    __slots__ = ()
 
     def __init__(self, target: EventTarget = None):
         Event.__init__(self, target)
@@ -272,6 +273,7 @@ class Die(Event):
     """Kill target. If target is self and this is run from a block then destroy the block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_die?view=minecraft-bedrock-stable)"""
 
     id = Identifier("die")
+    __slots__ = ()
 
     def __init__(self, target: EventTarget = None):
         Event.__init__(self, target)
@@ -293,6 +295,7 @@ class PlayEffect(Event):
     """Spawns a particle effect relative to target position. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_play_effect?view=minecraft-bedrock-stable)"""
 
     id = Identifier("play_effect")
+    __slots__ = ("_effect", "_data")
 
     def __init__(self, effect: Identifiable, data: int = 0, target: EventTarget = None):
         Event.__init__(self, target)
@@ -315,7 +318,7 @@ class PlayEffect(Event):
 
     @property
     def effect(self) -> Identifier:
-        return getattr(self, "_effect")
+        return self._effect
 
     @effect.setter
     def effect(self, value: Identifiable):
@@ -325,7 +328,7 @@ class PlayEffect(Event):
 
     @property
     def data(self) -> int:
-        return getattr(self, "_data")
+        return self._data
 
     @data.setter
     def data(self, value: int):
@@ -343,6 +346,7 @@ class PlaySound(Event):
     """Play a sound relative to target position. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_play_sound?view=minecraft-bedrock-stable)"""
 
     id = Identifier("play_sound")
+    __slots__ = ("_sound",)
 
     def __init__(self, sound: Identifiable, target: EventTarget = None):
         Event.__init__(self, target)
@@ -363,7 +367,7 @@ class PlaySound(Event):
 
     @property
     def sound(self) -> Identifier:
-        return getattr(self, "_sound")
+        return self._sound
 
     @sound.setter
     def sound(self, value: Identifiable):
@@ -377,6 +381,7 @@ class RemoveMobEffect(Event):
     """Removes mob effect from target. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_remove_mob_effect?view=minecraft-bedrock-stable)"""
 
     id = Identifier("remove_mob_effect")
+    __slots__ = ("_effect",)
 
     def __init__(self, effect: Identifiable, target: EventTarget = None):
         Event.__init__(self, target)
@@ -397,7 +402,7 @@ class RemoveMobEffect(Event):
 
     @property
     def effect(self) -> Identifier:
-        return getattr(self, "_effect")
+        return self._effect
 
     @effect.setter
     def effect(self, value: Identifiable):
@@ -411,6 +416,7 @@ class RunCommand(Event):
     """Triggers a slash command or a list of slash commands. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_run_command?view=minecraft-bedrock-stable)"""
 
     id = Identifier("run_command")
+    __slots__ = ("_command",)
 
     def __init__(self, command: str | list[str], target: EventTarget = None):
         Event.__init__(self, target)
@@ -433,7 +439,7 @@ class RunCommand(Event):
 
     @property
     def command(self) -> list[str]:
-        return getattr(self, "_command")
+        return self._command
 
     @command.setter
     def command(self, value: list[str]):
@@ -463,6 +469,7 @@ class SetBlock(Event):
     """Sets this block to another block type. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_set_block?view=minecraft-bedrock-stable)"""
 
     id = Identifier("set_block")
+    __slots__ = ("_block_type",)
 
     def __init__(self, block_type: Identifiable):
         self.block_type = block_type
@@ -479,7 +486,7 @@ class SetBlock(Event):
 
     @property
     def block_type(self) -> Identifier:
-        return getattr(self, "_block_type")
+        return self._block_type
 
     @block_type.setter
     def block_type(self, value: Identifiable):
@@ -493,6 +500,7 @@ class SetBlockAtPos(Event):
     """Sets a block relative to this block to another block type. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_set_block_at_pos?view=minecraft-bedrock-stable)"""
 
     id = Identifier("set_block_at_pos")
+    __slots__ = ("_block_type", "_block_offset")
 
     def __init__(
         self, block_type: Identifiable, block_offset: Vector3 = Vector3(0, 0, 0)
@@ -516,7 +524,7 @@ class SetBlockAtPos(Event):
 
     @property
     def block_type(self) -> Identifier:
-        return getattr(self, "_block_type")
+        return self._block_type
 
     @block_type.setter
     def block_type(self, value: Identifiable):
@@ -526,7 +534,7 @@ class SetBlockAtPos(Event):
 
     @property
     def block_offset(self) -> Vector3:
-        return getattr(self, "_block_offset")
+        return self._block_offset
 
     @block_offset.setter
     def block_offset(self, value: Vector3):
@@ -543,6 +551,7 @@ class SpawnLoot(Event):
     """Spawn loot from block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_spawn_loot?view=minecraft-bedrock-stable)"""
 
     id = Identifier("spawn_loot")
+    __slots__ = ("_table",)
 
     def __init__(self, table: str):
         self.table = table
@@ -559,7 +568,7 @@ class SpawnLoot(Event):
 
     @property
     def table(self) -> str:
-        return getattr(self, "_table")
+        return self._table
 
     @table.setter
     def table(self, value: str):
@@ -572,6 +581,7 @@ class Swing(Event):
     """Event causes the actor to swing. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_swing?view=minecraft-bedrock-stable)"""
 
     id = Identifier("swing")
+    __slots__ = ()
 
     def __init__(self, target: EventTarget = None):
         Event.__init__(self, target)
@@ -586,6 +596,7 @@ class Teleport(Event):
     """Teleport target randomly around destination point. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_teleport?view=minecraft-bedrock-stable)"""
 
     id = Identifier("teleport")
+    __slots__ = ("_avoid_water", "_destination", "_land_on_block", "_max_range")
 
     def __init__(
         self,
@@ -623,7 +634,7 @@ class Teleport(Event):
 
     @property
     def avoid_water(self) -> bool:
-        return getattr(self, "_avoid_water")
+        return self._avoid_water
 
     @avoid_water.setter
     def avoid_water(self, value: bool):
@@ -636,7 +647,7 @@ class Teleport(Event):
 
     @property
     def destination(self) -> Vector3:
-        return getattr(self, "_destination")
+        return self._destination
 
     @destination.setter
     def destination(self, value: Vector3):
@@ -649,7 +660,7 @@ class Teleport(Event):
 
     @property
     def land_on_block(self) -> bool:
-        return getattr(self, "_land_on_block")
+        return self._land_on_block
 
     @land_on_block.setter
     def land_on_block(self, value: bool):
@@ -662,7 +673,7 @@ class Teleport(Event):
 
     @property
     def max_range(self) -> Vector3:
-        return getattr(self, "_max_range")
+        return self._max_range
 
     @max_range.setter
     def max_range(self, value: Vector3):
@@ -679,6 +690,7 @@ class TransformIem(Event):
     """Transforms item into another item. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_transform_item?view=minecraft-bedrock-stable)"""
 
     id = Identifier("transform_item")
+    __slots__ = ("_transform",)
 
     def __init__(self, transform: Identifiable):
         self.transform = transform
@@ -695,7 +707,7 @@ class TransformIem(Event):
 
     @property
     def transform(self) -> Identifier:
-        return getattr(self, "_transform")
+        return self._transform
 
     @transform.setter
     def transform(self, value: Identifiable):
@@ -709,8 +721,9 @@ class SetBlockProperty(Event):
     """Sets a block state on this block. [MS Docs](https://learn.microsoft.com/en-us/minecraft/creator/reference/content/blockreference/examples/blockevents/minecraftblock_set_block_state?view=minecraft-bedrock-stable)"""
 
     id = Identifier("set_block_state")
+    __slots__ = ("_states",)
 
-    def __init__(self, states: dict[Identifiable, Molang] = {}):
+    def __init__(self, states: dict[Identifiable, Molang] = None):
         self.states = states
 
     def jsonify(self):
@@ -733,6 +746,8 @@ class SetBlockProperty(Event):
 
     @states.setter
     def states(self, value: dict[Identifiable, Molang]):
+        if value is None:
+            value = {}
         if not isinstance(value, dict):
             raise TypeError(
                 f"Expected dict but got '{value.__class__.__name__}' instead"
@@ -787,7 +802,7 @@ class Sequence(Event):
 
     @property
     def events(self) -> list[dict]:
-        return getattr(self, "_events")
+        return self._events
 
     @events.setter
     def events(self, value: list[dict]):
@@ -856,11 +871,11 @@ class Trigger(Event):
     """Trigger an event on a specified target."""
 
     id = Identifier("trigger")
+    __slots__ = ("_event", "_condition")
 
     def __init__(
         self, event: Identifiable, condition: Molang = None, target: str = None
     ):
-        Event.__init__(self, target)
         self.event = event
         self.condition = None if condition is None else Molang(condition)
         self.target = target
@@ -888,7 +903,7 @@ class Trigger(Event):
     @property
     def condition(self) -> Molang:
         """The condition of event to be executed on the object, defaults to None"""
-        return getattr(self, "_condition")
+        return self._condition
 
     @condition.setter
     def condition(self, value: Molang):
@@ -905,7 +920,7 @@ class Trigger(Event):
     @property
     def event(self) -> Identifier:
         """The event executed on the block"""
-        return getattr(self, "_event")
+        return self._event
 
     @event.setter
     def event(self, value: Identifiable | str):
@@ -923,7 +938,7 @@ class Trigger(Event):
         if value is None:
             self.target = EventTarget.SELF
             return
-        if not isinstance(value, EventTarget):
+        if __debug__ and not isinstance(value, EventTarget):
             raise TypeError(
                 f"Expected EventTarget but got '{value.__class__.__name__}' instead"
             )
@@ -937,6 +952,8 @@ class Trigger(Event):
 class IncrementBlockProperty(SetBlockProperty):
     """Increase a block state on this block"""
 
+    __slots__ = ()
+
     def __init__(self, name: Identifiable, count: int = 1):
         id = Identifiable.of(name)
         SetBlockProperty.__init__(self, {id: f"q.block_state('{id}')+{count}"})
@@ -945,6 +962,8 @@ class IncrementBlockProperty(SetBlockProperty):
 class DecrementBlockProperty(SetBlockProperty):
     """Decrease a block state on this block"""
 
+    __slots__ = ()
+
     def __init__(self, name: Identifiable, count: int = 1):
         id = Identifiable.of(name)
         SetBlockProperty.__init__(self, {id: f"q.block_state('{id}')-{count}"})
@@ -953,6 +972,8 @@ class DecrementBlockProperty(SetBlockProperty):
 class SwitchBlockProperty(SetBlockProperty):
     """Switch a boolean block state on this block. (true -> false, false -> true)"""
 
+    __slots__ = ()
+
     def __init__(self, name: Identifiable):
         id = Identifiable.of(name)
         SetBlockProperty.__init__(self, {id: f"!q.block_state('{id}')"})
@@ -4,9 +4,8 @@ from PIL import Image, ImageFile
 from dataclasses import dataclass
 import os
 import chevron
-import commentjson
+import json
 import tempfile
-import jsonschema
 import zipfile
 import tarfile
 
@@ -48,6 +47,8 @@ class Schema:
                 if os.path.isabs(self.schemafile)
                 else os.path.join(os.path.dirname(__file__), "schemas", self.schemafile)
             )
+            import commentjson
+
             with open(path, "r") as fd:
                 self.cache = commentjson.load(fd)
         return self.cache
@@ -140,6 +141,8 @@ class Loader:
             s = self.get_schema(version)
             if s is not None:
                 schema = s.schema()
+                import jsonschema
+
                 try:
                     # resolver = jsonschema.RefResolver(base_uri='file://'+os.path.dirname(__file__), store={})
                     jsonschema.validate(obj, schema)
@@ -395,12 +398,16 @@ class JsonFile(File):
     @classmethod
     def jsonfile(cls, fp: str) -> dict:
         """Opens fp and returns the result as JSON"""
+        import commentjson
+
         with open(fp, "r") as fd:
             return commentjson.load(fd)
 
     @classmethod
     def load(cls, fileobj: TextIOWrapper, args: dict[str, str] = {}) -> Self:
         """Deserialize fp (a .read()-supporting file-like object containing a JSON document) to a Python object."""
+        import commentjson
+
         text = chevron.render(fileobj.read(), args, warn=True)
         self = cls.from_dict(commentjson.loads(text))
         self.filename = getattr(fileobj, "name", None)
@@ -409,13 +416,15 @@ class JsonFile(File):
     @classmethod
     def loads(cls, s: str, args: dict[str, str] = {}) -> Self:
         """Deserialize s (a str, bytes or bytearray instance containing a JSON document) to a Python object."""
+        import commentjson
+
         text = chevron.render(s, args, warn=True)
         self = cls.from_dict(commentjson.loads(text))
         return self
 
     def dumps(self, indent: int = 2, **kw) -> str:
         """Serialize obj to a JSON formatted str."""
-        return commentjson.dumps(self.jsonify(), indent=indent, **kw)
+        return json.dumps(self.jsonify(), indent=indent, **kw)
 
     def valid(self, fp: str) -> bool:
         """
@@ -23,8 +23,7 @@ class Vector2(np.ndarray):
         return not np.array_equal(self, other)
 
     def __iter__(self):
-        for x in np.nditer(self):
-            yield x.item()
+        return iter(self.tolist())
 
     def dist(self, other):
         return np.linalg.norm(self - other)
@@ -42,7 +41,7 @@ class Vector2(np.ndarray):
         return Vector2.of(data)
 
     def jsonify(self) -> dict:
-        return [float(x) for x in self]
+        return [float(x) for x in self.tolist()]
 
 
 class Vector3(np.ndarray):
@@ -69,8 +68,7 @@ class Vector3(np.ndarray):
         return not np.array_equal(self, other)
 
     def __iter__(self):
-        for x in np.nditer(self):
-            yield x.item()
+        return iter(self.tolist())
 
     def dist(self, other):
         return np.linalg.norm(self - other)
@@ -88,7 +86,7 @@ class Vector3(np.ndarray):
         return Vector3.of(data)
 
     def jsonify(self) -> dict:
-        return [float(x) for x in self]
+        return [float(x) for x in self.tolist()]
 
 
 class Range(np.ndarray):
@@ -111,8 +109,7 @@ class Range(np.ndarray):
         return not np.array_equal(self, other)
 
     def __iter__(self):
-        for x in np.nditer(self):
-            yield x.item()
+        return iter(self.tolist())
 
     def dist(self, other):
         return np.linalg.norm(self - other)
@@ -137,7 +134,7 @@ class Range(np.ndarray):
             return Range(min, max)
 
     def to_list(self) -> dict:
-        return [x for x in self]
+        return self.tolist()
 
     def jsonify(self, prefix: str = "") -> dict:
         data = {}
@@ -209,8 +206,7 @@ class Slope(np.ndarray):
         return not np.array_equal(self, other)
 
     def __iter__(self):
-        for x in np.nditer(self):
-            yield x.item()
+        return iter(self.tolist())
 
     def dist(self, other):
         return np.linalg.norm(self - other)
@@ -232,7 +228,7 @@ class Slope(np.ndarray):
         return Range(rise, run)
 
     def to_list(self) -> dict:
-        return [x for x in self]
+        return self.tolist()
 
     def jsonify(self, prefix: str = "") -> dict:
         data = {}
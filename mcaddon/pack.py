@@ -1,8 +1,7 @@
-from typing import Self
+from typing import Self, TYPE_CHECKING
 from zipfile import ZIP_DEFLATED, ZipFile
 from multiprocessing import Pool
 from io import BytesIO
-import mclang
 import os
 import glob
 import json
@@ -20,14 +19,22 @@ from .util import (
     clearitems,
     Identifier,
     Identifiable,
+    scanfiles,
 )
 from .registry import INSTANCE, Registries, RegistryKey
 
+if TYPE_CHECKING:
+    # mclang pulls in deep_translator and requests, import it when texts are used.
+    import mclang
+
 
 # TODO: Instead of creating self.items, self.blocks, etc. add self.registry = {'item': RegistryKey()}
 class Pack(ArchiveFile, Importable):
     def __init__(
-        self, manifest: Manifest = None, texts: mclang.Lang = None, filename: str = None
+        self,
+        manifest: Manifest = None,
+        texts: "mclang.Lang" = None,
+        filename: str = None,
     ):
         self.manifest = manifest
         self.texts = texts
@@ -94,11 +101,15 @@ class Pack(ArchiveFile, Importable):
         setattr(self, "_manifest", value)
 
     @property
-    def texts(self) -> mclang.Lang:
+    def texts(self) -> "mclang.Lang":
+        import mclang
+
         return getattr2(self, "_texts", mclang.Lang())
 
     @texts.setter
-    def texts(self, value: mclang.Lang):
+    def texts(self, value: "mclang.Lang"):
+        import mclang
+
         if value is None:
             self.texts = mclang.Lang()
             return
@@ -169,15 +180,18 @@ class Pack(ArchiveFile, Importable):
         self.manifest = Manifest.open(manifest_path)
 
         # Load registry files
+        # Several file types share a directory (features, recipes), scan each once.
+        listings = {}
         for k, cls in self.registry.items():
             obj = cls.__new__(cls)
             start = os.path.join(path, obj.dirname)
-            if os.path.isdir(start):
-                for fp in glob.glob(start + "/**/*" + obj.extension, recursive=True):
-                    bl = obj.valid(fp)
-                    if bl:
-                        file = obj.open(fp, start)
-                        self.add(file)
+            if start not in listings:
+                listings[start] = scanfiles(start) if os.path.isdir(start) else {}
+            for fp in listings[start].get(obj.extension, []):
+                bl = obj.valid(fp)
+                if bl:
+                    file = obj.open(fp, start)
+                    self.add(file)
 
         return self
 
@@ -206,6 +220,8 @@ class Pack(ArchiveFile, Importable):
             )
 
     def dump_directory(self, path: str, indent: int = 2) -> None:
+        import mclang
+
         props = {"indent": indent}
 
         # MANIFEST
@@ -252,6 +268,8 @@ class Pack(ArchiveFile, Importable):
             raise TypeError(
                 f"Expected zipfile.ZipFile but got '{zip.__class__.__name__}' instead"
             )
+        import mclang
+
         props = {"separators": (",", ":")}
         path = ""
 
@@ -357,7 +375,10 @@ class BehaviorPack(Pack):
     suffix = "_BP"
 
     def __init__(
-        self, manifest: Manifest = None, texts: mclang.Lang = None, filename: str = None
+        self,
+        manifest: Manifest = None,
+        texts: "mclang.Lang" = None,
+        filename: str = None,
     ):
         Pack.__init__(self, manifest, texts, filename)
         self._create_file_methods()
@@ -422,7 +443,10 @@ class ResourcePack(Pack):
     suffix = "_RP"
 
     def __init__(
-        self, manifest: Manifest = None, texts: mclang.Lang = None, filename: str = None
+        self,
+        manifest: Manifest = None,
+        texts: "mclang.Lang" = None,
+        filename: str = None,
     ):
         Pack.__init__(self, manifest, texts, filename)
         self._create_file_methods()
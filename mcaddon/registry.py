@@ -78,11 +78,7 @@ class RegistryKey:
         return self.instances.items()
 
     def get(self, identifier: Identifiable):
-        id = Identifiable.of(identifier)
-        for k, v in self.instances.items():
-            if k == id:
-                return v
-        return None
+        return self.instances.get(Identifiable.of(identifier))
 
     def register(self, identifier: Identifiable, obj):
         if not issubclass(obj, self.type):
@@ -27,30 +27,32 @@ class BlockSchema1(Schema):
         if "components" in data:
             comp = data["components"]
             tags = BlockTagsComponent()
+            registry = INSTANCE.get_registry(Registries.BLOCK_COMPONENT_TYPE)
             for k, v in comp.items():
                 id = Identifier(k)
                 if str(id).startswith("tag:"):
                     tags.add_tag(id.path)
                     continue
-                clazz = INSTANCE.get_registry(Registries.BLOCK_COMPONENT_TYPE).get(id)
+                clazz = registry.get(id)
                 if clazz is None:
                     raise ComponentNotFoundError(repr(id))
                 self.components[id] = clazz.from_dict(v)
 
             # Add tag
             if len(tags.tags) >= 1:
-                self.components[Identifier("tags")] = tags
+                self.components[tags.id] = tags
 
         if "permutations" in data:
             for perm in data["permutations"]:
                 self.permutations.append(BlockPermutation.from_dict(perm))
 
         if "events" in data:
+            registry = INSTANCE.get_registry(Registries.EVENT_TYPE)
             for k, v in data["events"].items():
                 name = Identifier(k)
                 for kk, vv in v.items():
                     id = Identifier(kk)
-                    clazz = INSTANCE.get_registry(Registries.EVENT_TYPE).get(id)
+                    clazz = registry.get(id)
                     if clazz is None:
                         raise EventNotFoundError(repr(id))
                     if id not in self.events:
@@ -1,10 +1,37 @@
 from typing import Self, Callable, Any
+from functools import lru_cache
 import re
 import os
 
 from .constant import Category, ItemGroup
 from .math import Vector3
 
+_PATH_PATTERN = re.compile(r"^[a-zA-Z-0-9/_\.:]+$")
+_NAMESPACE_PATTERN = re.compile(r"^[a-z0-9_]+$")
+
+
+@lru_cache(maxsize=4096)
+def _split_identifier(value: str) -> tuple[str, str | None]:
+    """Split and validate an identifier string into (namespace, path)."""
+    if ":" in value:
+        namespace, path = value.split(":", 1)
+    else:
+        namespace, path = "minecraft", value
+    # Validate then strip, the same as the namespace and path setters
+    if namespace == "" or namespace.lower() == "none":
+        namespace = "minecraft"
+    elif _NAMESPACE_PATTERN.match(namespace) is None:
+        raise ValueError(repr(namespace))
+    else:
+        namespace = namespace.strip()
+    if path == "":
+        path = None
+    elif _PATH_PATTERN.match(path) is None:
+        raise ValueError(path)
+    else:
+        path = path.strip()
+    return namespace, path
+
 
 def stringify(self, args):
     inner = ", ".join([f"{k}={repr(getattr(self, k))}" for k in args])
@@ -67,18 +94,42 @@ def setattr2(obj, name: str, value, type=None):
     """
     setattr method but has type checking and list/dict defaults.
     """
-    if value is None:
+    if value is None and type is not None:
         if issubclass(type, list):
             value = []
         if issubclass(type, dict):
             value = {}
-    if type is not None and not isinstance(value, type):
+    if __debug__ and type is not None and not isinstance(value, type):
         raise TypeError(
-            f"Expected {type.__class__.__name__} but got '{value.__class__.__name__}' instead"
+            f"Expected {type.__name__} but got '{value.__class__.__name__}' instead"
         )
     setattr(obj, name, value)
 
 
+def scanfiles(path: str) -> dict[str, list[str]]:
+    """
+    Recursively lists all non-hidden files in a directory, grouped by extension.
+
+    :param path: The directory to scan
+    :type path: str
+    :return: Mapping of `.extension` to the file paths with that extension.
+    :rtype: dict[str, list[str]]
+    """
+    files = {}
+    dirs = [path]
+    while dirs:
+        with os.scandir(dirs.pop()) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    dirs.append(entry.path)
+                else:
+                    ext = os.path.splitext(entry.name)[1]
+                    files.setdefault(ext, []).append(entry.path)
+    return files
+
+
 def clearitems(obj, name: str):
     getattr(obj, name).clear()
     return obj
@@ -94,9 +145,9 @@ def getitem(obj, name: str, key: Any):
 
 def additem(obj, name: str, value: Any, key: Any = None, type=None):
     v = getattr(obj, name)
-    if type is not None and not isinstance(value, type):
+    if __debug__ and type is not None and not isinstance(value, type):
         raise TypeError(
-            f"Expected {type.__class__.__name__} but got '{value.__class__.__name__}' instead"
+            f"Expected {type.__name__} but got '{value.__class__.__name__}' instead"
         )
     if key is None:
         v.append(value)
@@ -106,6 +157,7 @@ def additem(obj, name: str, value: Any, key: Any = None, type=None):
 
 
 class Misc:
+    __slots__ = ()
     _events = {}
 
     def on_update(self, name: str, value: Any):
@@ -129,12 +181,19 @@ class Identifier(Misc):
 
     DEFAULT_NAMESPACE = "minecraft"
     SEPERATOR = ":"
+    __slots__ = ("_namespace", "_path", "_hash", "_str")
 
     def __init__(self, namespace: str, path: str = None):
         if path is None:
-            id = Identifier.of(namespace)
-            self.namespace = id.namespace
-            self.path = id.path
+            if isinstance(namespace, str):
+                self._parse(namespace)
+                if self._namespace == "none":
+                    # The old path ran the stripped "none\n" through the setter again
+                    self.namespace = self.DEFAULT_NAMESPACE
+            else:
+                id = Identifier.of(namespace)
+                self.namespace = id.namespace
+                self.path = id.path
         else:
             self.namespace = namespace
             self.path = path
@@ -143,11 +202,16 @@ class Identifier(Misc):
         return repr(str(self))
 
     def __str__(self) -> str:
-        return (
-            self.namespace
-            if self.path is None
-            else self.namespace + str(self.SEPERATOR) + self.path
-        )
+        # Serialized for every component key, only rebuild after a change
+        s = getattr(self, "_str", None)
+        if s is None:
+            s = (
+                self.namespace
+                if self.path is None
+                else self.namespace + str(self.SEPERATOR) + self.path
+            )
+            setattr(self, "_str", s)
+        return s
 
     def __eq__(self, other) -> bool:
         other = Identifiable.of(other)
@@ -166,7 +230,20 @@ class Identifier(Misc):
             yield x
 
     def __hash__(self):
-        return hash((self.namespace, self.path))
+        # Used as registry and component keys, only rehash after a change
+        h = getattr(self, "_hash", None)
+        if h is None:
+            h = hash((self.namespace, self.path))
+            setattr(self, "_hash", h)
+        return h
+
+    def __getstate__(self):
+        # str hashes are salted per process, so the cached hash is not pickled
+        return (self.namespace, self.path)
+
+    def __setstate__(self, state):
+        setattr(self, "_namespace", state[0])
+        setattr(self, "_path", state[1])
 
     @property
     def namespace(self) -> str:
@@ -182,6 +259,8 @@ class Identifier(Misc):
             v = str(value).strip()
             self.on_update("namespace", v)
             setattr(self, "_namespace", v)
+            setattr(self, "_hash", None)
+            setattr(self, "_str", None)
         else:
             raise ValueError(repr(value))
 
@@ -193,12 +272,16 @@ class Identifier(Misc):
     def path(self, value: str):
         if value is None or value == "":
             setattr(self, "_path", None)
+            setattr(self, "_hash", None)
+            setattr(self, "_str", None)
         elif isinstance(value, Identifier):
             self.path = value.path
         elif self.is_path_valid(str(value)):
             v = str(value).strip()
             self.on_update("path", v)
             setattr(self, "_path", v)
+            setattr(self, "_hash", None)
+            setattr(self, "_str", None)
         else:
             raise ValueError(value)
 
@@ -223,9 +306,19 @@ class Identifier(Misc):
         if isinstance(value, Identifier):
             return value.copy()
 
-        if str(value).count(Identifier.SEPERATOR) == 0:
-            return Identifier(Identifier.DEFAULT_NAMESPACE, value)
-        return Identifier(*str(value).split(Identifier.SEPERATOR, 1))
+        # Ids are mutable so only the parsed parts are cached, not instances
+        self = Identifier.__new__(Identifier)
+        self._parse(str(value))
+        return self
+
+    def _parse(self, value: str):
+        """Set the namespace and path from a cached parse of value"""
+        namespace, path = _split_identifier(value)
+        self.on_update("namespace", namespace)
+        self._namespace = namespace
+        if path is not None:
+            self.on_update("path", path)
+        self._path = path
 
     def jsonify(self) -> dict:
         data = {"namespace": self.namespace, "path": self.path}
@@ -241,7 +334,7 @@ class Identifier(Misc):
         :rtype: bool
         """
         v = self.path if path is None else path
-        res = re.match(r"^[a-zA-Z-0-9/_\.:]+$", v)
+        res = _PATH_PATTERN.match(v)
         return res is not None
 
     def is_namespace_valid(self, namespace: str = None) -> bool:
@@ -254,7 +347,7 @@ class Identifier(Misc):
         :rtype: bool
         """
         v = self.namespace if namespace is None else namespace
-        res = re.match(r"^[a-z0-9_]+$", v)
+        res = _NAMESPACE_PATTERN.match(v)
         return res is not None
 
     def copy_with_path(self, path: str) -> Self:
@@ -569,7 +662,15 @@ class MenuCategory(Misc):
         return MenuCategory(self.category, self.group)
 
 
+# Only used for comparisons, never handed out
+_CUBE_ORIGIN = Vector3(-8, 0, -8)
+_CUBE_SIZE = Vector3(16, 16, 16)
+_ZERO = Vector3(0, 0, 0)
+
+
 class Box(Misc):
+    __slots__ = ("_origin", "_size")
+
     def __init__(
         self, origin: Vector3 = Vector3(-8, 0, -8), size: Vector3 = Vector3(16, 16, 16)
     ):
@@ -589,24 +690,22 @@ class Box(Misc):
     @classmethod
     def from_dict(cls, data: dict) -> Self:
         self = cls.__new__(cls)
-        if "origin" in data:
-            self.origin = data.pop("origin")
-        if "size" in data:
-            self.size = data.pop("size")
+        self.origin = data.pop("origin") if "origin" in data else Vector3(-8, 0, -8)
+        self.size = data.pop("size") if "size" in data else Vector3(16, 16, 16)
         return self
 
     @property
     def origin(self) -> Vector3:
         """Minimal position of the bounds of the box. "origin" is specified as [x, y, z] and must be in the range (-8, 0, -8) to (8, 16, 8), inclusive, defaults to [-8.0, 0, -8.0]"""
-        return getattr(self, "_origin", Vector3(-8, 0, -8))
+        return self._origin
 
     @origin.setter
     def origin(self, value: Vector3):
         if isinstance(value, bool):
-            setattr(self, "_origin", value)
+            self._origin = value
         elif isinstance(value, Vector3):
             self.on_update("origin", value)
-            setattr(self, "_origin", value)
+            self._origin = value
         else:
             raise TypeError(
                 f"Expected Vector3 but got '{value.__class__.__name__}' instead"
@@ -615,7 +714,7 @@ class Box(Misc):
     @property
     def size(self) -> Vector3:
         """Size of each side of the box. Size is specified as [x, y, z]. "origin" + "size" must be in the range (-8, 0, -8) to (8, 16, 8), inclusive, defaults to [16.0, 16.0, 16.0]"""
-        return getattr(self, "_size", Vector3(16, 16, 16))
+        return self._size
 
     @size.setter
     def size(self, value: Vector3):
@@ -624,13 +723,13 @@ class Box(Misc):
                 f"Expected list[float] but got '{value.__class__.__name__}' instead"
             )
         self.on_update("size", value)
-        setattr(self, "_size", value)
+        self._size = value
 
     def is_cube(self) -> bool:
-        return self.origin == Vector3(-8, 0, -8) and self.size == Vector3(16, 16, 16)
+        return self.origin == _CUBE_ORIGIN and self.size == _CUBE_SIZE
 
     def is_none(self) -> bool:
-        return self.origin == Vector3(0, 0, 0) and self.size == Vector3(0, 0, 0)
+        return self.origin == _ZERO and self.size == _ZERO
 
     @classmethod
     def cube(cls) -> Self:
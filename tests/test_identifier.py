@@ -0,0 +1,61 @@
+import copy
+import pickle
+from mcaddon import *
+
+id = Identifier("test:sample")
+assert str(id) == "test:sample"
+h = hash(id)
+
+# Changing the path or namespace drops the cached str and hash
+id.path = "other"
+assert str(id) == "test:other"
+assert hash(id) == hash(Identifier("test:other"))
+assert hash(id) != h
+
+id.namespace = "demo"
+assert str(id) == "demo:other"
+assert hash(id) == hash(Identifier("demo:other"))
+assert id in {Identifier("demo:other"): True}
+
+# Copies and pickles
+for other in [id.copy(), copy.copy(id), copy.deepcopy(id)]:
+    assert other == id
+    assert hash(other) == hash(id)
+    assert str(other) == str(id)
+
+other = id.copy_with_path("sample")
+assert str(other) == "demo:sample"
+assert str(id) == "demo:other"
+
+other = pickle.loads(pickle.dumps(id))
+assert other == id
+assert hash(other) == hash(id)
+assert str(other) == "demo:other"
+other.path = "changed"
+assert str(other) == "demo:changed"
+assert str(id) == "demo:other"
+
+# Parsed parts are validated then stripped like the setters
+assert Identifier.of("foo\n").path == "foo"
+assert str(Identifier.of("a:b\n")) == "a:b"
+assert str(Identifier.of("a\n:b")) == "a:b"
+assert Identifier.of("a:b\n") == Identifier("a", "b\n")
+for value in [" foo ", "a: b", "a:\n", "\nfoo"]:
+    try:
+        Identifier.of(value)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(repr(value))
+
+# Single strings passed to Identifier() parse the same way
+assert Identifier("foo\n").path == "foo"
+assert str(Identifier("a:b\n")) == "a:b"
+assert str(Identifier("none\n:x")) == "minecraft:x"
+for value in [" foo ", "a: b"]:
+    try:
+        Identifier(value)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(repr(value))
@@ -0,0 +1,47 @@
+from mcaddon import *
+
+# Instances share the class VALUES until one of them is modified
+a = CardinalDirectionState()
+b = CardinalDirectionState()
+assert a._values is CardinalDirectionState.VALUES
+assert b._values is CardinalDirectionState.VALUES
+print(a.jsonify(), a.default(), a.get_value(0), list(a))
+assert a._values is CardinalDirectionState.VALUES
+
+a.add_value("up")
+assert a.values == ["north", "south", "east", "west", "up"]
+assert CardinalDirectionState.VALUES == ("north", "south", "east", "west")
+assert b._values is CardinalDirectionState.VALUES
+
+a.remove_value(0)
+a.clear_values()
+assert a.values == []
+assert CardinalDirectionState.VALUES == ("north", "south", "east", "west")
+
+a.values = ["north"]
+assert b._values is CardinalDirectionState.VALUES
+
+# values is a list of this state's own values
+s = CardinalDirectionState()
+assert s.values == ["north", "south", "east", "west"]
+s.values.append("up")
+assert s.values == ["north", "south", "east", "west", "up"]
+s.values = s.values
+assert CardinalDirectionState.VALUES == ("north", "south", "east", "west")
+assert CardinalDirectionState().values == ["north", "south", "east", "west"]
+
+# Boolean states
+c = OpenBitState()
+d = OpenBitState()
+assert c._values is d._values is BooleanState.VALUES
+c.add_value(True)
+assert c.values == [False, True, True]
+assert d.values == [False, True]
+assert BooleanState.VALUES == (False, True)
+
+# Membership
+assert "north" in b
+assert "up" not in b
+assert True in OpenBitState()
+assert 3 in AgeState()
+assert 16 not in AgeState()